@@ -3,16 +3,21 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from collections import defaultdict
+
+_HEADER_IDS = frozenset(("id", "node_id", "mdisk_id", "enclosure_id"))
+
 
 def parse_ibm_svc_with_header(info, dflt_header):
-    parsed: dict = {}
-    header = dflt_header
+    parsed: defaultdict[str, list[dict]] = defaultdict(list)
+    header_keys = dflt_header[1:]
     for line in info:
         if " command not found" in line:
             continue
-        elif line[0] in ["id", "node_id", "mdisk_id", "enclosure_id"]:
+        elif line[0] in _HEADER_IDS:
             # newer agent output provides a header line
-            header = line
+            header_keys = line[1:]
         else:
-            parsed.setdefault(line[0], []).append(dict(zip(header[1:], line[1:])))
-    return parsed
+            parsed[line[0]].append(dict(zip(header_keys, line[1:])))
+    # don't hand out the defaultdict, lookups of unknown items must not create entries
+    return dict(parsed)
@@ -24,9 +24,15 @@ def inventory_esx_vsphere_sensors(info):
     yield None, {}
 
 
+_SENSOR_STATES = {"green": 0, "yellow": 1, "red": 2, "unknown": 3}
+
+
 def check_esx_vsphere_sensors(_no_item, params, info):
-    mulitline = ["All sensors are in normal state", "Sensors operating normal are:"]
+    summary = "All sensors are in normal state"
+    header = "Sensors operating normal are:"
+    details = []
     mod_msg = " (Alert state has been modified by Check_MK rule)"
+    rules = [(entry.get("name", ""), entry.get("states", {})) for entry in params["rules"]]
 
     for (
         name,
@@ -39,22 +45,25 @@ def check_esx_vsphere_sensors(_no_item, params, info):
         health_label,
         health_summary,
     ) in info:
-        sensor_state = {"green": 0, "yellow": 1, "red": 2, "unknown": 3}.get(health_key.lower(), 2)
+        sensor_state = _SENSOR_STATES.get(health_key.lower(), 2)
         txt = f"{name}: {health_label} ({health_summary})"
 
-        for entry in params["rules"]:
-            if name.startswith(entry.get("name", "")):
-                new_state = entry.get("states", {}).get(str(sensor_state))
+        modified = False
+        for rule_name, rule_states in rules:
+            if name.startswith(rule_name):
+                new_state = rule_states.get(str(sensor_state))
                 if new_state is not None:
                     sensor_state = new_state
                     txt += mod_msg
+                    modified = True
                     break
-        if sensor_state > 0 or txt.endswith(mod_msg):
+        if sensor_state > 0 or modified:
             yield sensor_state, txt
-            mulitline[:2] = "", "At least one sensor reported. Sensors readings are:"
-        mulitline.append(txt)
+            summary = ""
+            header = "At least one sensor reported. Sensors readings are:"
+        details.append(txt)
 
-    yield 0, "\n".join(mulitline)
+    yield 0, "\n".join([summary, header, *details])
 
 
 def parse_esx_vsphere_sensors(string_table: StringTable) -> StringTable:
@@ -10,10 +10,15 @@ from cmk.agent_based.v2 import StringTable
 check_info = {}
 
 
+def _vbox_guest_property_key(name):
+    # strip the leading "/VirtualBox/", raises ValueError on unexpected names
+    return name[name.index("/", name.index("/") + 1) + 1 :].rstrip(",")
+
+
 def vbox_guest_make_dict(info):
     # output differs in version 6.x so we need to deal with empty values for
     # /VirtualBox/GuestInfo/OS/ServicePack
-    return {l[1].split("/", 2)[2].rstrip(","): l[3] if len(l) == 4 else "" for l in info}
+    return {_vbox_guest_property_key(l[1]): l[3] if len(l) == 4 else "" for l in info}
 
 
 def check_vbox_guest(_no_item, _no_params, info):
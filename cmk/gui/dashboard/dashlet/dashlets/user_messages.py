@@ -3,6 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from cmk.gui import message
 from cmk.gui.dashboard.dashlet.base import Dashlet
 from cmk.gui.dashboard.type_defs import DashletConfig
 from cmk.gui.i18n import _
@@ -32,4 +33,4 @@ class MessageUsersDashlet(Dashlet[MessageUsersDashletConfig]):
         return 75
 
     def show(self):
-        render_user_message_table("dashlet")
+        render_user_message_table("dashlet", message.get_gui_messages())
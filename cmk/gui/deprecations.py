@@ -4,14 +4,17 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import datetime
+import functools
+import heapq
 import json
+import os
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
-from livestatus import SiteConfigurations, SiteId
+from livestatus import SiteConfiguration, SiteConfigurations, SiteId
 
 from cmk.ccc import store
 
@@ -31,7 +34,7 @@ from cmk.gui.site_config import get_site_config, is_wato_slave_site
 from cmk.gui.sites import states
 from cmk.gui.userdb import load_users
 from cmk.gui.utils import gen_id
-from cmk.gui.utils.roles import user_may
+from cmk.gui.utils.roles import may_with_roles, roles_of_user
 from cmk.gui.watolib.analyze_configuration import ACResultState, ACTestResult, perform_tests
 
 from cmk.discover_plugins import addons_plugins_local_path, plugins_local_path
@@ -57,26 +60,32 @@ class _MarkerFileStore:
     ) -> None:
         marker_file = self._folder / str(site_id) / site_version
         store.makedirs(marker_file.parent)
-        store.save_text_to_file(marker_file, json.dumps([repr(r) for r in ac_test_results]))
+        store.save_text_to_file(marker_file, json.dumps([r.to_dict() for r in ac_test_results]))
 
     def cleanup_site_dir(self, site_id: SiteId) -> None:
-        for filepath, _mtime in sorted(
-            [
-                (marker_file, marker_file.stat().st_mtime)
-                for marker_file in list((self._folder / site_id).iterdir())
-            ],
-            key=lambda t: t[1],
-            reverse=True,
-        )[5:]:
-            filepath.unlink(missing_ok=True)
+        with os.scandir(self._folder / site_id) as entries:
+            marker_files = [(Path(entry.path), entry.stat().st_mtime) for entry in entries]
+        latest_marker_files = {
+            filepath for filepath, _mtime in heapq.nlargest(5, marker_files, key=lambda t: t[1])
+        }
+        for filepath, _mtime in marker_files:
+            if filepath not in latest_marker_files:
+                filepath.unlink(missing_ok=True)
 
     def cleanup_empty_dirs(self) -> None:
-        for path in self._folder.iterdir():
-            if path.is_dir() and not list(path.iterdir()):
+        with os.scandir(self._folder) as entries:
+            for entry in entries:
+                if not entry.is_dir() or not _is_empty_dir(entry.path):
+                    continue
                 try:
-                    path.rmdir()
+                    os.rmdir(entry.path)
                 except OSError:
-                    logger.error("Cannot remove %r", path)
+                    logger.error("Cannot remove %r", entry.path)
+
+
+def _is_empty_dir(path: str) -> bool:
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
 
 
 def _filter_non_ok_ac_test_results(
@@ -89,8 +98,14 @@ def _filter_non_ok_ac_test_results(
     }
 
 
-def _filter_extension_managing_users(user_ids: Sequence[UserId]) -> Sequence[UserId]:
-    return [u for u in user_ids if user_may(u, "wato.manage_mkps")]
+def _filter_extension_managing_users(user_ids: Iterable[UserId]) -> Iterator[UserId]:
+    # Determine the permitted roles once instead of evaluating the permission for every user
+    permitted_role_ids = {
+        role_id for role_id in active_config.roles if may_with_roles([role_id], "wato.manage_mkps")
+    }
+    for user_id in user_ids:
+        if not permitted_role_ids.isdisjoint(roles_of_user(user_id)):
+            yield user_id
 
 
 def _make_path_config() -> PathConfig | None:
@@ -136,11 +151,47 @@ def _group_manifests_by_path(
     return manifests_by_path
 
 
+def _package_dirs_mtime_ns() -> tuple[int, ...]:
+    mtimes: list[int] = []
+    for package_dir in (paths.local_optional_packages_dir, paths.local_enabled_packages_dir):
+        try:
+            mtimes.append(package_dir.stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(-1)
+    return tuple(mtimes)
+
+
+def _load_manifests_by_path() -> Mapping[Path, Manifest]:
+    if (path_config := _make_path_config()) is None:
+        return {}
+    return _load_manifests_by_path_for(path_config, _package_dirs_mtime_ns())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_manifests_by_path_for(
+    path_config: PathConfig, _mtimes_ns: tuple[int, ...]
+) -> Mapping[Path, Manifest]:
+    # The mtimes are only used as cache key: (un)packaging MKPs modifies the package directories.
+    return _group_manifests_by_path(
+        path_config,
+        get_stored_manifests(
+            PackageStore(
+                shipped_dir=paths.optional_packages_dir,
+                local_dir=paths.local_optional_packages_dir,
+                enabled_dir=paths.local_enabled_packages_dir,
+            )
+        ).local,
+    )
+
+
 def _find_manifest(
-    manifests_by_path: Mapping[Path, Manifest], ac_test_result_path: Path
+    manifests_by_parts: Mapping[tuple[str, ...], Manifest], ac_test_result_path: Path
 ) -> Manifest | None:
-    for path, manifest in manifests_by_path.items():
-        if str(ac_test_result_path.resolve()).endswith(str(path)):
+    # The known paths may be absolute or relative, so look up every suffix of the result path,
+    # longest first.
+    parts = ac_test_result_path.resolve().parts
+    for idx in range(len(parts)):
+        if (manifest := manifests_by_parts.get(parts[idx:])) is not None:
             return manifest
     return None
 
@@ -186,13 +237,21 @@ def _find_ac_test_result_problems(
     not_ok_ac_test_results: Mapping[SiteId, Sequence[ACTestResult]],
     manifests_by_path: Mapping[Path, Manifest],
 ) -> Sequence[_ACTestResultProblem]:
+    manifests_by_parts = {path.parts: manifest for path, manifest in manifests_by_path.items()}
+    # Several tests may report the same file, resolve and look up each path only once.
+    manifest_by_ac_test_result_path: dict[Path, Manifest | None] = {}
     problem_by_ident: dict[str, _ACTestResultProblem] = {}
     for site_id, ac_test_results in not_ok_ac_test_results.items():
         for ac_test_result in ac_test_results:
             if ac_test_result.path:
                 path = _try_rel_path(site_id, ac_test_result.path)
 
-                if manifest := _find_manifest(manifests_by_path, ac_test_result.path):
+                if ac_test_result.path not in manifest_by_ac_test_result_path:
+                    manifest_by_ac_test_result_path[ac_test_result.path] = _find_manifest(
+                        manifests_by_parts, ac_test_result.path
+                    )
+
+                if manifest := manifest_by_ac_test_result_path[ac_test_result.path]:
                     problem = problem_by_ident.setdefault(
                         manifest.name,
                         _ACTestResultProblem(manifest.name, "mkp"),
@@ -220,11 +279,12 @@ def execute_deprecation_tests_and_notify_users() -> None:
 
     marker_file_store = _MarkerFileStore(Path(paths.var_dir) / "deprecations")
 
-    site_versions_by_site_id = {
-        site_id: site_version
-        for site_id, site_state in states().items()
-        if (site_version := site_state.get("program_version"))
-    }
+    site_versions_by_site_id: dict[SiteId, str] = {}
+    site_configs_by_site_id: dict[SiteId, SiteConfiguration] = {}
+    for site_id, site_state in states().items():
+        if site_version := site_state.get("program_version"):
+            site_versions_by_site_id[site_id] = site_version
+            site_configs_by_site_id[site_id] = get_site_config(active_config, site_id)
 
     if not (
         not_ok_ac_test_results := _filter_non_ok_ac_test_results(
@@ -232,12 +292,7 @@ def execute_deprecation_tests_and_notify_users() -> None:
                 logger,
                 active_config,
                 request,
-                SiteConfigurations(
-                    {
-                        site_id: get_site_config(active_config, site_id)
-                        for site_id in site_versions_by_site_id
-                    }
-                ),
+                SiteConfigurations(site_configs_by_site_id),
                 categories=["deprecations"],
             )
         )
@@ -250,28 +305,14 @@ def execute_deprecation_tests_and_notify_users() -> None:
 
     marker_file_store.cleanup_empty_dirs()
 
-    manifests_by_path = (
-        _group_manifests_by_path(
-            path_config,
-            get_stored_manifests(
-                PackageStore(
-                    shipped_dir=paths.optional_packages_dir,
-                    local_dir=paths.local_optional_packages_dir,
-                    enabled_dir=paths.local_enabled_packages_dir,
-                )
-            ).local,
-        )
-        if (path_config := _make_path_config())
-        else {}
-    )
-
     ac_test_results_messages = [
-        str(p) for p in _find_ac_test_result_problems(not_ok_ac_test_results, manifests_by_path)
+        str(p)
+        for p in _find_ac_test_result_problems(not_ok_ac_test_results, _load_manifests_by_path())
     ]
 
     now = int(time.time())
-    for user_id in _filter_extension_managing_users(list(load_users())):
-        sent_messages = [m["text"] for m in get_gui_messages(user_id)]
+    for user_id in _filter_extension_managing_users(load_users()):
+        sent_messages = {m["text"] for m in get_gui_messages(user_id)}
         for ac_test_results_message in ac_test_results_messages:
             if ac_test_results_message in sent_messages:
                 continue
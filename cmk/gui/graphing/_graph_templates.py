@@ -42,7 +42,7 @@ from ._graph_specification import (
     HorizontalRule,
     MinimalVerticalRange,
 )
-from ._graphs_order import GRAPHS_ORDER
+from ._graphs_order import graphs_order_index
 from ._metric_expression import (
     Average,
     BaseMetricExpression,
@@ -78,13 +78,8 @@ from ._utils import get_graph_data_from_livestatus
 def _sort_registered_graph_plugins(
     registered_graphs: Mapping[str, graphs_api.Graph | graphs_api.Bidirectional],
 ) -> list[tuple[str, graphs_api.Graph | graphs_api.Bidirectional]]:
-    def _by_index(graph_name: str) -> int:
-        try:
-            return GRAPHS_ORDER.index(graph_name)
-        except ValueError:
-            return -1
-
-    return sorted(registered_graphs.items(), key=lambda t: _by_index(t[0]))
+    order_index = graphs_order_index()
+    return sorted(registered_graphs.items(), key=lambda t: order_index.get(t[0], -1))
 
 
 def _parse_title(template: graphs_api.Graph | graphs_api.Bidirectional) -> str:
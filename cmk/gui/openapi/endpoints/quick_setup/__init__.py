@@ -256,9 +256,9 @@ def quicksetup_run_stage_action(params: Mapping[str, Any]) -> Response:
         )
 
     stage_index = StageIndex(len(body["stages"]) - 1)
-    stage_action = matching_stage_action(quick_setup.stages[stage_index](), stage_action_id)
-
     built_stages = [stage() for stage in quick_setup.stages[: stage_index + 1]]
+    stage_action = matching_stage_action(built_stages[stage_index], stage_action_id)
+
     form_spec_map = build_formspec_map_from_stages(built_stages)
     stages_raw_formspecs = [RawFormData(stage["form_data"]) for stage in body["stages"]]
     # Validate the stage formspec data; this is separate from the custom validators of the stage
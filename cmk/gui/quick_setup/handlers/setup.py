@@ -71,13 +71,13 @@ OVERVIEW_MODE_STRING = _("Overview mode")
 COMPLETE_BUTTON_ARIA_LABEL = _("Save")
 
 
-@dataclass
+@dataclass(slots=True)
 class StageOverview:
     title: str
     sub_title: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickSetupOverview:
     quick_setup_id: QuickSetupId
     overviews: list[StageOverview]
@@ -143,7 +143,7 @@ def quick_setup_guided_mode(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class CompleteStage:
     title: str
     sub_title: str | None
@@ -152,7 +152,7 @@ class CompleteStage:
     prev_button: Button
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickSetupAllStages:
     quick_setup_id: QuickSetupId
     stages: list[CompleteStage]
@@ -222,15 +222,17 @@ def validate_stages_form_data(
     stages_raw_form_data: Sequence[RawFormData],
     quick_setup_formspec_map: FormspecMap,
 ) -> Sequence[ValidationErrors] | None:
-    stages_errors = []
-    for stage_index in range(len(stages_raw_form_data)):
-        errors = validate_stage_formspecs(
-            stage_index=StageIndex(stage_index),
-            stages_raw_formspecs=stages_raw_form_data[: stage_index + 1],
-            quick_setup_formspec_map=quick_setup_formspec_map,
-        )
-        if errors.exist():
-            stages_errors.append(errors)
+    stages_errors = [
+        errors
+        for stage_index in range(len(stages_raw_form_data))
+        if (
+            errors := validate_stage_formspecs(
+                stage_index=StageIndex(stage_index),
+                stages_raw_formspecs=stages_raw_form_data,
+                quick_setup_formspec_map=quick_setup_formspec_map,
+            )
+        ).exist()
+    ]
     return stages_errors or None
 
 
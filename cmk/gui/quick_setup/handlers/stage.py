@@ -7,11 +7,11 @@ import os
 import traceback
 import uuid
 from collections.abc import Mapping, Sequence
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 from livestatus import SiteId
 
@@ -96,6 +96,8 @@ def _stage_validate_all_form_spec_keys_existing(
     current_stage_form_data: RawFormData,
     expected_formspecs_map: Mapping[FormSpecId, FormSpec],
 ) -> GeneralStageErrors:
+    if current_stage_form_data.keys() <= expected_formspecs_map.keys():
+        return []
     return [
         f"Formspec id '{form_spec_id}' not found"
         for form_spec_id in current_stage_form_data.keys()
@@ -221,7 +223,7 @@ class StageActionResult(BaseModel, frozen=False):
     validation_errors: ValidationErrors | None = None
     # TODO: This should be a list of widgets using only Sequence[Widget] will remove all fields
     #  when the data is returned (this is a temporary fix)
-    stage_recap: Sequence[Any] = field(default_factory=list)
+    stage_recap: Sequence[Any] = Field(default_factory=list)
     background_job_exception: BackgroundJobException | None = None
 
     @classmethod
@@ -229,12 +231,15 @@ class StageActionResult(BaseModel, frozen=False):
         work_dir = str(Path(BackgroundJobDefines.base_dir) / job_id)
         if not os.path.exists(work_dir):
             raise MKInternalError(None, _("Stage action result not found"))
-        content = store.load_text_from_file(cls._file_path(work_dir))
+        # pydantic parses the raw bytes directly, no need to decode them first
+        content = store.load_bytes_from_file(cls._file_path(work_dir))
         try:
             return cls.model_validate_json(content)
         except ValidationError as e:
             raise MKInternalError(
-                None, f"Error reading stage action result with content: {content}"
+                None,
+                "Error reading stage action result with content: "
+                f"{content.decode('utf-8', errors='replace')}",
             ) from e
 
     def save_to_file(self, work_dir: str) -> None:
@@ -261,10 +266,11 @@ def verify_custom_validators_and_recap_stage(
         progress_logger = InfoLogger()
 
     response = StageActionResult()
+    stages_raw_formspecs = [RawFormData(stage["form_data"]) for stage in input_stages]
     if (
         errors := verify_stage_custom_validators(
             quick_setup=quick_setup,
-            stages_raw_formspecs=[RawFormData(stage["form_data"]) for stage in input_stages],
+            stages_raw_formspecs=stages_raw_formspecs,
             stage_index=stage_index,
             stage_action_id=stage_action_id,
             stages=built_stages,
@@ -280,7 +286,7 @@ def verify_custom_validators_and_recap_stage(
         stage_index=stage_index,
         stages=built_stages,
         stage_action_id=stage_action_id,
-        stages_raw_formspecs=[RawFormData(stage["form_data"]) for stage in input_stages],
+        stages_raw_formspecs=stages_raw_formspecs,
         quick_setup_formspec_map=form_spec_map,
         progress_logger=progress_logger,
     )
@@ -421,7 +427,7 @@ def quick_setup_stage_action_job_entry_point(
     ).run_quick_setup_stage_action(job_interface)
 
 
-@dataclass
+@dataclass(slots=True)
 class NextStageStructure:
     components: Sequence[dict]
     actions: Sequence[Action]
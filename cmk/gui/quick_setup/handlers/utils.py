@@ -3,8 +3,10 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 import enum
+import functools
 from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
+from itertools import chain
 from typing import Any, cast
 
 from pydantic import BaseModel
@@ -50,14 +52,14 @@ NEXT_BUTTON_LABEL = _("Next")
 NEXT_BUTTON_ARIA_LABEL = _("Go to the next stage")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressStep:
     title: str
     status: StepStatus
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressState:
     steps: Sequence[ProgressStep]
 
@@ -138,20 +140,20 @@ class JobBasedProgressLogger:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonIcon:
     name: str
     rotate: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Button:
     label: str
     aria_label: str
     icon: ButtonIcon | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     id: ActionId
     button: Button
@@ -164,14 +166,23 @@ def form_spec_parse(
 ) -> ParsedFormData:
     return {
         form_spec_id: parse_value_from_frontend(expected_formspecs_map[form_spec_id], form_data)
-        for current_stage_form_data in all_stages_form_data
-        for form_spec_id, form_data in current_stage_form_data.items()
+        for form_spec_id, form_data in chain.from_iterable(
+            current_stage_form_data.items() for current_stage_form_data in all_stages_form_data
+        )
     }
 
 
+@functools.cache
+def _container_field_names(widget_type: type[Widget]) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(widget_type) if f.name != "items")
+
+
 def get_stage_components_from_widget(widget: Widget, prefill_data: ParsedFormData | None) -> dict:
     if isinstance(widget, (ListOfWidgets, Collapsible, ConditionalNotificationStageWidget)):
-        widget_as_dict = asdict(widget)
+        # Don't use asdict here: it would deep copy all items, just to have them replaced below
+        widget_as_dict = {
+            name: getattr(widget, name) for name in _container_field_names(type(widget))
+        }
         widget_as_dict["items"] = [
             get_stage_components_from_widget(item, prefill_data) for item in widget.items
         ]
@@ -195,7 +206,7 @@ def get_stage_components_from_widget(widget: Widget, prefill_data: ParsedFormDat
     return asdict(widget)
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickSetupValidationError:
     message: str
     invalid_value: Any
@@ -205,7 +216,7 @@ class QuickSetupValidationError:
 ValidationErrorMap = MutableMapping[FormSpecId, MutableSequence[QuickSetupValidationError]]
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationErrors:
     """Data class representing errors that occurred during the validation process
 
@@ -238,13 +249,12 @@ def validate_custom_validators(
     progress_logger: ProgressLogger,
 ) -> ValidationErrors:
     errors = ValidationErrors(stage_index=None)
+    parsed_form_data: ParsedFormData | None = None
     for custom_validator in custom_validators:
+        if parsed_form_data is None:
+            parsed_form_data = form_spec_parse(stages_raw_formspecs, quick_setup_formspec_map)
         errors.stage_errors.extend(
-            custom_validator(
-                quick_setup_id,
-                form_spec_parse(stages_raw_formspecs, quick_setup_formspec_map),
-                progress_logger,
-            )
+            custom_validator(quick_setup_id, parsed_form_data, progress_logger)
         )
     return errors
 
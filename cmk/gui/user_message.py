@@ -4,7 +4,8 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from operator import itemgetter
 
 from cmk.gui import message
 from cmk.gui.breadcrumb import Breadcrumb, make_simple_page_breadcrumb
@@ -14,6 +15,7 @@ from cmk.gui.http import request
 from cmk.gui.i18n import _, ungettext
 from cmk.gui.logged_in import user
 from cmk.gui.main_menu import mega_menu_registry
+from cmk.gui.message import Message
 from cmk.gui.page_menu import (
     make_simple_link,
     PageMenu,
@@ -41,7 +43,7 @@ class PageUserMessage(Page):
     def title(self) -> str:
         return _("User messages")
 
-    def page_menu(self, breadcrumb: Breadcrumb) -> PageMenu:
+    def page_menu(self, breadcrumb: Breadcrumb, messages: Sequence[Message]) -> PageMenu:
         return PageMenu(
             dropdowns=[
                 PageMenuDropdown(
@@ -50,7 +52,7 @@ class PageUserMessage(Page):
                     topics=[
                         PageMenuTopic(
                             title=_("Received messages"),
-                            entries=list(_page_menu_entries_ack_all_messages()),
+                            entries=list(_page_menu_entries_ack_all_messages(messages)),
                         ),
                     ],
                 ),
@@ -70,26 +72,28 @@ class PageUserMessage(Page):
 
     def page(self) -> None:
         breadcrumb = make_simple_page_breadcrumb(mega_menu_registry.menu_user(), _("Messages"))
-        make_header(html, self.title(), breadcrumb, self.page_menu(breadcrumb))
+        messages = message.get_gui_messages()
+        make_header(html, self.title(), breadcrumb, self.page_menu(breadcrumb, messages))
 
         for flashed_msg in get_flashed_messages():
             html.show_message(flashed_msg.msg)
 
-        _handle_ack_all()
+        if _handle_ack_all(messages):
+            messages = message.get_gui_messages()
 
         html.open_div(class_="wato")
-        render_user_message_table("gui_hint")
+        render_user_message_table("gui_hint", messages)
         html.close_div()
 
         html.footer()
 
 
-def _handle_ack_all() -> None:
+def _handle_ack_all(messages: Sequence[Message]) -> bool:
     if not transactions.check_transaction():
-        return
+        return False
 
     if request.var("_ack_all"):
-        num = len([msg for msg in message.get_gui_messages() if not msg.get("acknowledged")])
+        num = sum(1 for msg in messages if not msg.get("acknowledged"))
         message.acknowledge_all_messages()
         flash(
             _("%d %s.")
@@ -103,9 +107,11 @@ def _handle_ack_all() -> None:
             )
         )
         html.reload_whole_page()
+        return True
+    return False
 
 
-def _page_menu_entries_ack_all_messages() -> Iterator[PageMenuEntry]:
+def _page_menu_entries_ack_all_messages(messages: Sequence[Message]) -> Iterator[PageMenuEntry]:
     yield PageMenuEntry(
         title=_("Acknowledge all"),
         icon_name="werk_ack",
@@ -118,7 +124,7 @@ def _page_menu_entries_ack_all_messages() -> Iterator[PageMenuEntry]:
                 confirm_button=_("Acknowledge all"),
             )
         ),
-        is_enabled=bool([msg for msg in message.get_gui_messages() if not msg.get("acknowledged")]),
+        is_enabled=any(not msg.get("acknowledged") for msg in messages),
     )
 
 
@@ -143,7 +149,7 @@ def _page_menu_entries_related() -> Iterator[PageMenuEntry]:
         )
 
 
-def render_user_message_table(what: str) -> None:
+def render_user_message_table(what: str, messages: Sequence[Message]) -> None:
     html.open_div()
     with table_element(
         "user_messages",
@@ -151,10 +157,10 @@ def render_user_message_table(what: str) -> None:
         searchable=False,
         empty_text=_("Currently you have no recieved messages"),
     ) as table:
-        for entry in sorted(message.get_gui_messages(), key=lambda e: e["time"], reverse=True):
-            if what not in entry["methods"]:
-                continue
-
+        entries = [entry for entry in messages if what in entry["methods"]]
+        entries.sort(key=itemgetter("time"), reverse=True)
+        reload_js = "cmk.utils.reload_whole_page();" if what == "gui_hint" else ""
+        for entry in entries:
             table.row()
 
             msg_id = entry["id"]
@@ -187,17 +193,11 @@ def render_user_message_table(what: str) -> None:
                     "delete", _("Cannot be deleted manually, must expire"), cssclass="colorless"
                 )
             else:
-                onclick = (
-                    "cmk.utils.delete_user_message('%s', this);cmk.utils.reload_whole_page();"
-                    % msg_id
-                    if what == "gui_hint"
-                    else "cmk.utils.delete_user_message('%s', this);" % msg_id
-                )
                 html.icon_button(
                     "",
                     _("Delete"),
                     "delete",
-                    onclick=onclick,
+                    onclick=f"cmk.utils.delete_user_message('{msg_id}', this);{reload_js}",
                 )
 
             table.cell(_("Message"), msg)
@@ -97,28 +97,29 @@ class ACTestResult:
             path=None if (p := repr_data.get("path")) is None else Path(p),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "site_id": self.site_id,
+            "state": self.state.value,
+            "text": self.text,
+            # These fields are be static - at least for the current version, but
+            # we transfer them to the central system to be able to handle test
+            # results of tests not known to the central site.
+            "test_id": self.test_id,
+            "category": self.category,
+            "title": self.title,
+            "help": self.help,
+            # this field is needed by 2.2 central sites to deserialize
+            "class_name": {
+                ACResultState.OK: "ACResultOK",
+                ACResultState.WARN: "ACResultWARN",
+                ACResultState.CRIT: "ACResultCRIT",
+            }[self.state],
+            "path": str(self.path) if self.path else None,
+        }
+
     def __repr__(self) -> str:
-        return repr(
-            {
-                "site_id": self.site_id,
-                "state": self.state.value,
-                "text": self.text,
-                # These fields are be static - at least for the current version, but
-                # we transfer them to the central system to be able to handle test
-                # results of tests not known to the central site.
-                "test_id": self.test_id,
-                "category": self.category,
-                "title": self.title,
-                "help": self.help,
-                # this field is needed by 2.2 central sites to deserialize
-                "class_name": {
-                    ACResultState.OK: "ACResultOK",
-                    ACResultState.WARN: "ACResultWARN",
-                    ACResultState.CRIT: "ACResultCRIT",
-                }[self.state],
-                "path": str(self.path) if self.path else None,
-            }
-        )
+        return repr(self.to_dict())
 
 
 class ACTestCategories:
@@ -336,6 +337,8 @@ def perform_tests(
         )
         for site_id in test_sites
     }
+    # No further tasks: let the worker threads terminate once the site tests are done
+    pool.close()
 
     results_by_site_id: dict[SiteId, list[ACTestResult]] = {}
     while active_tasks:
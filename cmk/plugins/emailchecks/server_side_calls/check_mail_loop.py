@@ -51,13 +51,12 @@ def check_mail_loop_arguments(
 
     send_protocol, send_params = params.send
 
-    args.append(f"--send-protocol={send_protocol}")
     send_server = (
         host_config.primary_ip_config.address
         if send_params.server is None
         else replace_macros(send_params.server, host_config.macros)
     )
-    args.append(f"--send-server={send_server}")
+    args.extend([f"--send-protocol={send_protocol}", f"--send-server={send_server}"])
 
     if (port := send_params.connection.port) is not None:
         args.append(f"--send-port={port}")
@@ -102,8 +101,7 @@ def check_mail_loop_arguments(
     else:
         raise NotImplementedError(f"Sending mails is not implemented for {send_protocol}")
 
-    args.append(f"--mail-from={params.mail_from}")
-    args.append(f"--mail-to={params.mail_to}")
+    args.extend([f"--mail-from={params.mail_from}", f"--mail-to={params.mail_to}"])
 
     if params.delete_messages:
         args.append("--delete-messages")
@@ -112,8 +110,7 @@ def check_mail_loop_arguments(
 
     _levels_type, levels = params.duration
     if levels is not None:
-        args.append(f"--warning={levels[0]:.0f}")
-        args.append(f"--critical={levels[1]:.0f}")
+        args.extend([f"--warning={levels[0]:.0f}", f"--critical={levels[1]:.0f}"])
 
     if params.subject is not None:
         args.append(f"--subject={params.subject}")
@@ -18,14 +18,14 @@ def commandstring(command_txt, username_txt, password_txt):
 
 
 def query(s, command_txt):
-    s.sendall(command_txt)
-    response = []
+    s.sendall(command_txt.encode())
+    response: list[bytes] = []
     while True:
-        next_part = s.recv(2048)
+        next_part = s.recv(65536)
         response.append(next_part)
         if not next_part:
             break
-    return "".join(response)
+    return b"".join(response).decode("utf-8", errors="replace")
 
 
 def main(sys_argv=None):
@@ -63,5 +63,6 @@ def main(sys_argv=None):
         sys.stdout.write("<<<%s>>>\n" % section)
         sock = socket.socket(family=socket.AF_INET, type=socket.SOCK_STREAM)
         sock.connect((ip_address, port))
-        sys.stdout.write(query(sock, commandstring(command, username, password)) + "\n")
+        sys.stdout.write(query(sock, commandstring(command, username, password)))
+        sys.stdout.write("\n")
         sock.close()
@@ -5,13 +5,20 @@
 from tests.unit.cmk.gui.quick_setup.factories import QuickSetupFactory
 
 from cmk.gui.quick_setup.handlers.stage import recap_stage
-from cmk.gui.quick_setup.handlers.utils import InfoLogger
+from cmk.gui.quick_setup.handlers.utils import get_stage_components_from_widget, InfoLogger
 from cmk.gui.quick_setup.v0_unstable._registry import quick_setup_registry
 from cmk.gui.quick_setup.v0_unstable.predefined import build_formspec_map_from_stages
 from cmk.gui.quick_setup.v0_unstable.predefined._recaps import recaps_form_spec
 from cmk.gui.quick_setup.v0_unstable.setups import QuickSetupStage, QuickSetupStageAction
 from cmk.gui.quick_setup.v0_unstable.type_defs import ActionId, RawFormData, StageIndex
-from cmk.gui.quick_setup.v0_unstable.widgets import FormSpecId, FormSpecRecap, FormSpecWrapper
+from cmk.gui.quick_setup.v0_unstable.widgets import (
+    Collapsible,
+    FormSpecId,
+    FormSpecRecap,
+    FormSpecWrapper,
+    ListOfWidgets,
+    Text,
+)
 
 from cmk.rulesets.v1 import Title
 from cmk.rulesets.v1.form_specs import DictElement, Dictionary, FieldSize, String, validators
@@ -72,3 +79,24 @@ def test_form_spec_recap() -> None:
     assert stage_recap[0].form_spec.data == {  # type: ignore[attr-defined]
         "test_dict_element": "I am a test string"
     }
+
+
+def test_get_stage_components_from_nested_widgets() -> None:
+    assert get_stage_components_from_widget(
+        Collapsible(
+            title="collapsible",
+            items=[ListOfWidgets(items=[Text(text="text")], list_type="bullet")],
+        ),
+        prefill_data=None,
+    ) == {
+        "widget_type": "collapsible",
+        "title": "collapsible",
+        "help_text": None,
+        "items": [
+            {
+                "widget_type": "list_of_widgets",
+                "list_type": "bullet",
+                "items": [{"widget_type": "text", "text": "text", "tooltip": None}],
+            }
+        ],
+    }
@@ -3,22 +3,42 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import json
+import os
 from collections.abc import Mapping, Sequence
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
 
+from tests.unit.cmk.web_test_app import SetConfig
+
 from livestatus import SiteId
 
+from cmk.utils import paths
+from cmk.utils.user import UserId
+
+from cmk.gui import deprecations
 from cmk.gui.deprecations import (
     _ACTestResultProblem,
+    _filter_extension_managing_users,
     _filter_non_ok_ac_test_results,
     _find_ac_test_result_problems,
+    _find_manifest,
     _MarkerFileStore,
 )
+from cmk.gui.utils.roles import may_with_roles, roles_of_user
 from cmk.gui.watolib.analyze_configuration import ACResultState, ACTestResult
 
-from cmk.mkp_tool import Manifest, PackageName, PackagePart, PackageVersion
+from cmk.mkp_tool import (
+    Manifest,
+    PackageName,
+    PackagePart,
+    PackageStore,
+    PackageVersion,
+    PathConfig,
+)
+from cmk.mkp_tool._unsorted import StoredManifests
 
 
 def test__marker_file_store_save(tmp_path: Path) -> None:
@@ -27,6 +47,25 @@ def test__marker_file_store_save(tmp_path: Path) -> None:
     assert (tmp_path / "deprecations/site_id/2.4.0").exists()
 
 
+def test__marker_file_store_save_ac_test_results(tmp_path: Path) -> None:
+    ac_test_result = ACTestResult(
+        ACResultState.WARN,
+        "text",
+        "test_id",
+        "deprecations",
+        "Title",
+        "Help",
+        SiteId("site_id"),
+        Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+    )
+    marker_file_store = _MarkerFileStore(tmp_path / "deprecations")
+    marker_file_store.save(SiteId("site_id"), "2.4.0", [ac_test_result])
+    assert [
+        ACTestResult.from_repr(r)
+        for r in json.loads((tmp_path / "deprecations/site_id/2.4.0").read_text())
+    ] == [ac_test_result]
+
+
 def test__marker_file_store_cleanup_site_dir(tmp_path: Path) -> None:
     marker_file_store = _MarkerFileStore(tmp_path / "deprecations")
     for idx in range(10):
@@ -158,6 +197,162 @@ def test__filter_non_ok_ac_test_results(
     assert _filter_non_ok_ac_test_results(ac_test_results_by_site_id) == result
 
 
+def _make_manifest() -> Manifest:
+    return Manifest(
+        title="asd",
+        name=PackageName("asd"),
+        description="",
+        version=PackageVersion("1.0.0"),
+        version_packaged="2.4.0-2025.03.05",
+        version_min_required="2.4.0-2025.03.05",
+        version_usable_until=None,
+        author="cmkadmin",
+        download_url="",
+        files={PackagePart("web"): [Path("plugins/metrics/file.py")]},
+    )
+
+
+@pytest.mark.parametrize(
+    "manifest_path, ac_test_result_path, found",
+    [
+        pytest.param(
+            Path("local/share/check_mk/web/plugins/metrics/file.py"),
+            Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+            True,
+            id="relative key",
+        ),
+        pytest.param(
+            Path("local/share/check_mk/web/plugins/metrics/file.py"),
+            Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/myfile.py"),
+            False,
+            id="other file name",
+        ),
+        pytest.param(
+            Path("local/share/check_mk/web/plugins/metrics/file.py"),
+            Path("/omd/sites/site_id/xlocal/share/check_mk/web/plugins/metrics/file.py"),
+            False,
+            id="partial directory name",
+        ),
+        pytest.param(
+            Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+            Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+            True,
+            id="absolute key",
+        ),
+        pytest.param(
+            Path("/omd/sites/site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+            Path("/omd/sites/other_site_id/local/share/check_mk/web/plugins/metrics/file.py"),
+            False,
+            id="absolute key of other site",
+        ),
+    ],
+)
+def test__find_manifest_matches_path_components(
+    manifest_path: Path, ac_test_result_path: Path, found: bool
+) -> None:
+    manifest = _make_manifest()
+    assert _find_manifest({manifest_path.parts: manifest}, ac_test_result_path) is (
+        manifest if found else None
+    )
+
+
+@pytest.mark.usefixtures("request_context")
+def test__filter_extension_managing_users(set_config: SetConfig) -> None:
+    with set_config(
+        roles={
+            "mkp_manager": {"alias": "MKP manager", "permissions": {"wato.manage_mkps": True}},
+            "viewer": {"alias": "Viewer", "permissions": {"wato.manage_mkps": False}},
+            "other": {"alias": "Other", "permissions": {"wato.manage_mkps": False}},
+        },
+        multisite_users={
+            UserId("permitted"): {"roles": ["mkp_manager"]},
+            UserId("not_permitted"): {"roles": ["viewer"]},
+            UserId("multiple_roles_permitted"): {"roles": ["viewer", "mkp_manager"]},
+            UserId("multiple_roles_not_permitted"): {"roles": ["viewer", "other"]},
+        },
+    ):
+        user_ids = [
+            UserId("permitted"),
+            UserId("not_permitted"),
+            UserId("multiple_roles_permitted"),
+            UserId("multiple_roles_not_permitted"),
+        ]
+        assert list(_filter_extension_managing_users(user_ids)) == [
+            UserId("permitted"),
+            UserId("multiple_roles_permitted"),
+        ]
+        assert list(_filter_extension_managing_users(user_ids)) == [
+            u for u in user_ids if may_with_roles(roles_of_user(u), "wato.manage_mkps")
+        ]
+
+
+def test__package_dirs_mtime_ns(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    optional_dir = tmp_path / "optional"
+    enabled_dir = tmp_path / "enabled"
+    monkeypatch.setattr(paths, "local_optional_packages_dir", optional_dir)
+    monkeypatch.setattr(paths, "local_enabled_packages_dir", enabled_dir)
+
+    assert deprecations._package_dirs_mtime_ns() == (-1, -1)
+
+    optional_dir.mkdir()
+    os.utime(optional_dir, ns=(1000, 2000))
+    assert deprecations._package_dirs_mtime_ns() == (2000, -1)
+
+    enabled_dir.mkdir()
+    os.utime(enabled_dir, ns=(3000, 4000))
+    assert deprecations._package_dirs_mtime_ns() == (2000, 4000)
+
+
+def test__load_manifests_by_path_reloads_after_package_dir_change(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    path_config = PathConfig(**{f.name: tmp_path for f in fields(PathConfig)})
+    monkeypatch.setattr(deprecations, "_make_path_config", lambda: path_config)
+    stored_manifests = [
+        StoredManifests(local=[], shipped=[]),
+        StoredManifests(local=[_make_manifest()], shipped=[]),
+    ]
+    loaded_stores: list[PackageStore] = []
+
+    def _get_stored_manifests(package_store: PackageStore) -> StoredManifests:
+        loaded_stores.append(package_store)
+        return stored_manifests[len(loaded_stores) - 1]
+
+    monkeypatch.setattr(deprecations, "get_stored_manifests", _get_stored_manifests)
+    mtimes_ns = (1, 1)
+    monkeypatch.setattr(deprecations, "_package_dirs_mtime_ns", lambda: mtimes_ns)
+    deprecations._load_manifests_by_path_for.cache_clear()
+
+    assert not deprecations._load_manifests_by_path()
+    assert not deprecations._load_manifests_by_path()
+    assert len(loaded_stores) == 1
+
+    mtimes_ns = (1, 2)
+    assert deprecations._load_manifests_by_path() == {
+        tmp_path.resolve() / "plugins/metrics/file.py": stored_manifests[1].local[0]
+    }
+    assert len(loaded_stores) == 2
+
+
+def test__load_manifests_by_path_does_not_cache_missing_path_config(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    path_config: PathConfig | None = None
+    monkeypatch.setattr(deprecations, "_make_path_config", lambda: path_config)
+    monkeypatch.setattr(
+        deprecations,
+        "get_stored_manifests",
+        lambda package_store: StoredManifests(local=[_make_manifest()], shipped=[]),
+    )
+    monkeypatch.setattr(deprecations, "_package_dirs_mtime_ns", lambda: (1, 1))
+    deprecations._load_manifests_by_path_for.cache_clear()
+
+    assert not deprecations._load_manifests_by_path()
+
+    path_config = PathConfig(**{f.name: tmp_path for f in fields(PathConfig)})
+    assert deprecations._load_manifests_by_path()
+
+
 @pytest.mark.parametrize(
     "ac_test_results_by_site_id, manifests_by_path, problems",
     [
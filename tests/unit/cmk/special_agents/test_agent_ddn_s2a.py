@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright (C) 2025 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import socket
+from collections.abc import Sequence
+
+import pytest
+
+from cmk.special_agents import agent_ddn_s2a
+
+
+class _FakeSocket:
+    def __init__(self, reply_chunks: Sequence[bytes]) -> None:
+        self.address: tuple[str, int] | None = None
+        self.sent = b""
+        self.recv_sizes: list[int] = []
+        self.closed = False
+        self._reply_chunks = list(reply_chunks)
+
+    def connect(self, address: tuple[str, int]) -> None:
+        self.address = address
+
+    def sendall(self, data: bytes) -> None:
+        self.sent += data
+
+    def recv(self, bufsize: int) -> bytes:
+        self.recv_sizes.append(bufsize)
+        return self._reply_chunks.pop(0) if self._reply_chunks else b""
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_query_decodes_reply_split_inside_multibyte_sequence() -> None:
+    # "ä" is encoded as b"\xc3\xa4" and split across two chunks
+    sock = _FakeSocket([b"OK \xc3", b"\xa4 b\n", b"c"])
+
+    reply = agent_ddn_s2a.query(sock, "1000@user@secret@0@0@$")
+
+    assert sock.sent == b"1000@user@secret@0@0@$"
+    assert reply == "OK ä b\nc"
+    assert sock.recv_sizes == [65536] * 4
+
+
+def test_query_replaces_undecodable_bytes() -> None:
+    assert agent_ddn_s2a.query(_FakeSocket([b"a\xffb"]), "1000@user@secret@0@0@$") == "a\ufffdb"
+
+
+def test_main(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    sockets: list[_FakeSocket] = []
+
+    def _make_socket(**kwargs: int) -> _FakeSocket:
+        assert kwargs == {"family": socket.AF_INET, "type": socket.SOCK_STREAM}
+        sockets.append(sock := _FakeSocket([f"reply {len(sockets)}".encode()]))
+        return sock
+
+    monkeypatch.setattr(socket, "socket", _make_socket)
+
+    agent_ddn_s2a.main(["192.0.2.1", "8008", "user", "secret"])
+
+    assert [(s.address, s.sent, s.closed) for s in sockets] == [
+        (("192.0.2.1", 8008), f"{command}@user@secret@0@0@$".encode(), True)
+        for command in ("1600", "1000", "2500", "2301", "0505", "2300")
+    ]
+    assert capsys.readouterr().out == (
+        "<<<ddn_s2a_faultsbasic>>>\nreply 0\n"
+        "<<<ddn_s2a_version>>>\nreply 1\n"
+        "<<<ddn_s2a_uptime>>>\nreply 2\n"
+        "<<<ddn_s2a_statsdelay>>>\nreply 3\n"
+        "<<<ddn_s2a_errors>>>\nreply 4\n"
+        "<<<ddn_s2a_stats>>>\nreply 5\n"
+    )